@@ -0,0 +1,174 @@
+"""Benchmark the automatic GrabCut rectangle against user-drawn rectangles.
+
+The fixture set is a handful of product-style photos generated here so no
+binary files have to live in the repo. Each fixture carries the rectangle a
+user would draw around the object: its bounding box plus a small margin,
+clipped to the image.
+
+The "studio" fixtures match what the detector assumes: a light, even
+background with a darker object kept away from the edges. The "hard"
+fixtures break those assumptions on purpose (low contrast, an object cut
+off by the border, a wall/table scene and a textured background) so the
+report shows where auto mode fails. Neither group stands in for real
+product photos.
+
+Run from the project root:
+
+    python -m benchmarks.auto_rect_benchmark
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from modules.grabcut.processor import GrabCutProcessor
+
+REPEATS = 20
+FAIL_IOU = 0.5  # Below this the proposal is no use as a starting rectangle
+
+
+def _background(h, w, rng, kind):
+    """Build a studio, wall/table or textured (busy) background"""
+    base = rng.integers(170, 250, size=3).astype(np.float32)
+    bg = np.ones((h, w, 3), np.float32) * base
+    if kind == "gradient":
+        ramp = np.linspace(-25, 25, h, dtype=np.float32)[:, None, None]
+        bg = bg + ramp
+    elif kind == "noisy":
+        bg = bg + rng.normal(0, 6, size=(h, w, 3))
+    elif kind == "wall_table":
+        # Light wall above a darker table, meeting at a horizon line
+        horizon = int(h * rng.uniform(0.55, 0.7))
+        bg[horizon:] = rng.integers(90, 150, size=3).astype(np.float32)
+        bg = bg + rng.normal(0, 4, size=(h, w, 3))
+    elif kind == "textured":
+        # Busy scene: fine texture plus other items scattered around
+        bg = bg + rng.normal(0, 12, size=(h, w, 3))
+        for _ in range(25):
+            iw = int(w * rng.uniform(0.03, 0.12))
+            ih = int(h * rng.uniform(0.03, 0.12))
+            ix, iy = int(rng.integers(0, w - iw)), int(rng.integers(0, h - ih))
+            shade = tuple(float(c) for c in rng.integers(0, 255, size=3))
+            cv2.rectangle(bg, (ix, iy), (ix + iw, iy + ih), shade, -1)
+    return bg
+
+
+def _make_fixture(seed, h, w, kind, shape, low_contrast=False, at_border=False):
+    """Draw one object on a background, returning the image and user rect"""
+    rng = np.random.default_rng(seed)
+    img = _background(h, w, rng, kind)
+
+    ow = int(w * rng.uniform(0.3, 0.6))
+    oh = int(h * rng.uniform(0.3, 0.6))
+    if at_border:
+        # Push the object past the right and bottom edges
+        ox = w - int(ow * rng.uniform(0.6, 0.9))
+        oy = h - int(oh * rng.uniform(0.7, 1.0))
+    else:
+        ox = int(rng.integers(w // 10, w - ow - w // 10))
+        oy = int(rng.integers(h // 10, h - oh - h // 10))
+
+    if low_contrast:
+        # Just off the colour of the background behind the object
+        centre = img[min(oy + oh // 2, h - 1), min(ox + ow // 2, w - 1)]
+        color = tuple(float(c) for c in centre + rng.uniform(-14, 14, size=3))
+    else:
+        color = tuple(float(c) for c in rng.integers(20, 160, size=3))
+
+    mask = np.zeros((h, w), np.uint8)
+    if shape == "ellipse":
+        cv2.ellipse(
+            mask, (ox + ow // 2, oy + oh // 2), (ow // 2, oh // 2), 0, 0, 360, 255, -1
+        )
+    elif shape == "box":
+        cv2.rectangle(mask, (ox, oy), (ox + ow, oy + oh), 255, -1)
+    else:
+        pts = np.array(
+            [
+                [ox + ow // 2, oy],
+                [ox + ow, oy + oh // 3],
+                [ox + int(ow * 0.8), oy + oh],
+                [ox + int(ow * 0.2), oy + oh],
+                [ox, oy + oh // 3],
+            ],
+            np.int32,
+        )
+        cv2.fillPoly(mask, [pts], 255)
+
+    texture = rng.normal(0, 4 if low_contrast else 10, size=(h, w, 3))
+    obj = np.array(color, np.float32) + texture
+    img[mask > 0] = obj[mask > 0]
+    img = np.clip(img, 0, 255).astype(np.uint8)
+
+    # A user draws a little outside the object's bounding box
+    x, y, bw, bh = cv2.boundingRect(mask)
+    margin = int(min(w, h) * rng.uniform(0.02, 0.06))
+    x0, y0 = max(x - margin, 0), max(y - margin, 0)
+    x1, y1 = min(x + bw + margin, w - 1), min(y + bh + margin, h - 1)
+    return img, (x0, y0, x1 - x0, y1 - y0)
+
+
+# (name, group, seed, height, width, background, shape, extra options)
+FIXTURES = [
+    ("plain_ellipse", "studio", 0, 600, 800, "plain", "ellipse", {}),
+    ("plain_box", "studio", 1, 800, 600, "plain", "box", {}),
+    ("gradient_polygon", "studio", 2, 720, 960, "gradient", "polygon", {}),
+    ("gradient_ellipse", "studio", 3, 1080, 1440, "gradient", "ellipse", {}),
+    ("noisy_box", "studio", 4, 900, 900, "noisy", "box", {}),
+    ("noisy_polygon", "studio", 5, 1200, 1600, "noisy", "polygon", {}),
+    ("low_contrast", "hard", 6, 600, 800, "plain", "ellipse", {"low_contrast": True}),
+    ("low_contrast_grad", "hard", 7, 720, 960, "gradient", "box", {"low_contrast": True}),
+    ("border_cutoff", "hard", 8, 600, 800, "plain", "polygon", {"at_border": True}),
+    ("border_cutoff_box", "hard", 9, 900, 900, "noisy", "box", {"at_border": True}),
+    ("wall_table", "hard", 10, 600, 800, "wall_table", "box", {}),
+    ("wall_table_ellipse", "hard", 11, 720, 960, "wall_table", "ellipse", {}),
+    ("textured", "hard", 12, 600, 800, "textured", "ellipse", {}),
+    ("textured_polygon", "hard", 13, 900, 900, "textured", "polygon", {}),
+]
+
+
+def _iou(a, b):
+    """Intersection over union of two (x, y, w, h) rectangles"""
+    ix = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union else 0.0
+
+
+def main():
+    processor = GrabCutProcessor()
+    print(
+        f"{'fixture':<20} {'group':<7} {'size':>10} {'median ms':>10} "
+        f"{'p95 ms':>8} {'IoU':>6}"
+    )
+
+    ious = {}
+    for name, group, seed, h, w, kind, shape, options in FIXTURES:
+        img, user_rect = _make_fixture(seed, h, w, kind, shape, **options)
+        processor.img = img
+
+        # Warm up so one-time OpenCV setup is not timed
+        processor.propose_rectangle()
+
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            rect = processor.propose_rectangle()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        iou = _iou(rect, user_rect)
+        ious.setdefault(group, []).append(iou)
+        flag = "  FAIL" if iou < FAIL_IOU else ""
+        print(
+            f"{name:<20} {group:<7} {w:>4}x{h:<5} {np.median(timings):>10.2f} "
+            f"{np.percentile(timings, 95):>8.2f} {iou:>6.3f}{flag}"
+        )
+
+    for group, values in ious.items():
+        print(f"mean IoU ({group}): {np.mean(values):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,12 @@ from PIL import Image
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Auto rectangle proposal settings
+AUTO_RECT_MAX_SIZE = 160  # Longest side of the downscaled analysis copy
+AUTO_RECT_BORDER = 0.05  # Fraction of each side sampled as background
+AUTO_RECT_PADDING = 0.02  # Padding added around the detected object
+AUTO_RECT_MIN_AREA = 0.005  # Smallest component kept, as a fraction of the image
+
 
 class GrabCutProcessor:
     def __init__(self):
@@ -53,13 +59,19 @@ class GrabCutProcessor:
             return False
 
     def set_rectangle(self, rect):
-        """Set rectangle for GrabCut"""
+        """Set rectangle for GrabCut, or propose one when rect is 'auto'"""
         try:
-            # Extract rectangle coordinates
-            x = int(rect["x"])
-            y = int(rect["y"])
-            w = int(rect["width"])
-            h = int(rect["height"])
+            if rect == "auto":
+                if self.img is None:
+                    logger.error("Image not set")
+                    return False
+                x, y, w, h = self.propose_rectangle()
+            else:
+                # Extract rectangle coordinates
+                x = int(rect["x"])
+                y = int(rect["y"])
+                w = int(rect["width"])
+                h = int(rect["height"])
 
             # Validate rectangle
             if (
@@ -80,6 +92,77 @@ class GrabCutProcessor:
             logger.exception(f"Error setting rectangle: {str(e)}")
             return False
 
+    def propose_rectangle(self):
+        """Propose a foreground rectangle from a downscaled copy of the image.
+
+        Pixels that differ from the colours along the image border, or that
+        sit on dense edges, are treated as foreground. The rectangle bounds
+        the remaining components, padded and mapped back to full resolution.
+        """
+        h, w = self.img.shape[:2]
+        scale = min(1.0, AUTO_RECT_MAX_SIZE / max(h, w))
+        small = cv2.resize(
+            self.img,
+            (max(1, round(w * scale)), max(1, round(h * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+        sh, sw = small.shape[:2]
+
+        # Background colour model from the image border, in Lab space
+        lab = cv2.cvtColor(small, cv2.COLOR_BGR2LAB).astype(np.float32)
+        b = max(1, round(min(sh, sw) * AUTO_RECT_BORDER))
+        border_mask = np.zeros((sh, sw), dtype=bool)
+        border_mask[:b] = border_mask[-b:] = True
+        border_mask[:, :b] = border_mask[:, -b:] = True
+        border = lab[border_mask]
+        center = np.median(border, axis=0)
+        border_dist = np.linalg.norm(border - center, axis=1)
+        dist = np.linalg.norm(lab - center, axis=2)
+        threshold = max(np.percentile(border_dist, 95) * 1.5, 12.0)
+        color_mask = dist > threshold
+
+        # Edge density catches objects close in colour to the background
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150).astype(np.float32) / 255.0
+        border_edges = edges[border_mask]
+        density = cv2.blur(edges, (5, 5))
+        edge_mask = density > max(border_edges.mean() * 3, 0.15)
+
+        fg = (color_mask | edge_mask).astype(np.uint8)
+        fg = cv2.morphologyEx(fg, cv2.MORPH_OPEN, np.ones((3, 3), np.uint8))
+
+        # Keep components large enough to be the object
+        count, _, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+        min_area = AUTO_RECT_MIN_AREA * sh * sw
+        boxes = [
+            stats[i, :4]
+            for i in range(1, count)
+            if stats[i, cv2.CC_STAT_AREA] >= min_area
+        ]
+
+        if boxes:
+            boxes = np.array(boxes)
+            x0 = boxes[:, 0].min()
+            y0 = boxes[:, 1].min()
+            x1 = (boxes[:, 0] + boxes[:, 2]).max()
+            y1 = (boxes[:, 1] + boxes[:, 3]).max()
+            pad_x = AUTO_RECT_PADDING * sw
+            pad_y = AUTO_RECT_PADDING * sh
+            x0, x1 = (x0 - pad_x) / scale, (x1 + pad_x) / scale
+            y0, y1 = (y0 - pad_y) / scale, (y1 + pad_y) / scale
+        else:
+            # Nothing stands out, fall back to a centred rectangle
+            logger.warning("No foreground found, using centred rectangle")
+            x0, x1 = w * 0.1, w * 0.9
+            y0, y1 = h * 0.1, h * 0.9
+
+        # GrabCut needs some background outside the rectangle
+        x0 = int(max(min(max(x0, 1), w - 2), 0))
+        y0 = int(max(min(max(y0, 1), h - 2), 0))
+        x1 = int(min(max(x1, x0 + 1), w - 1))
+        y1 = int(min(max(y1, y0 + 1), h - 1))
+        return (x0, y0, x1 - x0, y1 - y0)
+
     def run_grabcut(self, result_type="normal"):
         """Run GrabCut algorithm on the image"""
         try:
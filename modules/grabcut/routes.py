@@ -41,7 +41,7 @@ def process():
             logger.error("Failed to load image")
             return jsonify({"success": False, "error": "Failed to load image"})
 
-        # Set rectangle
+        # Set rectangle ("auto" proposes one from the image)
         if not processor.set_rectangle(data["rect"]):
             logger.error("Invalid rectangle coordinates")
             return jsonify({"success": False, "error": "Invalid rectangle coordinates"})
@@ -64,6 +64,7 @@ def process():
                 "success": True,
                 "result_image": results["result_image"],
                 "mask_image": results["mask_image"],
+                "rect": dict(zip(("x", "y", "width", "height"), processor.rect)),
             }
         )
 
@@ -72,6 +73,41 @@ def process():
         return jsonify({"success": False, "error": str(e)})
 
 
+@grabcut_bp.route("/propose", methods=["POST"])
+def propose():
+    """Propose a GrabCut rectangle without running the segmentation"""
+    try:
+        # Get request data
+        data = request.get_json()
+        if not data or "image" not in data:
+            logger.error("Missing required data")
+            return jsonify({"success": False, "error": "Missing required data"})
+
+        # Load image
+        if not processor.load_image(data["image"]):
+            logger.error("Failed to load image")
+            return jsonify({"success": False, "error": "Failed to load image"})
+
+        # Propose rectangle
+        if not processor.set_rectangle("auto"):
+            logger.error("Could not propose a rectangle")
+            return jsonify(
+                {"success": False, "error": "Could not propose a rectangle"}
+            )
+
+        logger.info(f"Proposed rectangle: {processor.rect}")
+        return jsonify(
+            {
+                "success": True,
+                "rect": dict(zip(("x", "y", "width", "height"), processor.rect)),
+            }
+        )
+
+    except Exception as e:
+        logger.exception(f"Error proposing rectangle: {str(e)}")
+        return jsonify({"success": False, "error": str(e)})
+
+
 @grabcut_bp.route("/save", methods=["POST"])
 def save():
     """Save processed results to files"""
@@ -10,6 +10,7 @@ let scaleFactor = 1;
 // UI Elements
 const imageInput = document.getElementById('imageInput');
 const resetBtn = document.getElementById('resetBtn');
+const autoRectBtn = document.getElementById('autoRectBtn');
 const runBtn = document.getElementById('runBtn');
 const resultType = document.getElementById('resultType');
 const resultImage = document.getElementById('resultImage');
@@ -75,6 +76,7 @@ function setupCanvas(image) {
     
     // Enable buttons
     resetBtn.disabled = false;
+    autoRectBtn.disabled = false;
     runBtn.disabled = false;
     resultType.disabled = false;
     
@@ -122,6 +124,65 @@ function resetCanvas() {
     updateStatus('Rectangle cleared. Draw a new selection.');
 }
 
+// Draw a rectangle (in original image coordinates) over the image
+function drawRect(r) {
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    ctx.drawImage(originalImage, 0, 0, canvas.width, canvas.height);
+    
+    ctx.strokeStyle = '#007bff';
+    ctx.lineWidth = 2;
+    ctx.strokeRect(
+        r.x / scaleFactor,
+        r.y / scaleFactor,
+        r.width / scaleFactor,
+        r.height / scaleFactor
+    );
+}
+
+// Ask the server to propose a rectangle around the object
+async function useAutoRect() {
+    if (!originalImage) return;
+    
+    try {
+        // Show loading overlay
+        loadingOverlay.style.display = 'flex';
+        updateStatus('Detecting object...');
+        
+        // Send request to server
+        const response = await fetch('/grabcut/propose', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ image: originalImage.src })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (!result.success) {
+            throw new Error(result.error || 'Detection failed');
+        }
+        
+        // Keep the proposal as the current selection
+        currentRect = result.rect;
+        drawRect(currentRect);
+        
+        updateStatus('Rectangle detected. Redraw it if needed, or click "Run GrabCut" to process.');
+        
+    } catch (error) {
+        console.error('Error:', error);
+        updateStatus('Error: ' + error.message);
+        alert('Error detecting object: ' + error.message);
+    } finally {
+        // Hide loading overlay
+        loadingOverlay.style.display = 'none';
+    }
+}
+
 // Mouse event handlers
 canvas.addEventListener('mousedown', function(e) {
     if (!originalImage) return;
@@ -200,18 +261,7 @@ canvas.addEventListener('mouseup', function(e) {
     };
     
     // Draw final rectangle
-    ctx.clearRect(0, 0, canvas.width, canvas.height);
-    ctx.drawImage(originalImage, 0, 0, canvas.width, canvas.height);
-    
-    // Draw solid border
-    ctx.strokeStyle = '#007bff';
-    ctx.lineWidth = 2;
-    ctx.strokeRect(
-        currentRect.x / scaleFactor,
-        currentRect.y / scaleFactor,
-        currentRect.width / scaleFactor,
-        currentRect.height / scaleFactor
-    );
+    drawRect(currentRect);
     
     isDrawing = false;
     canvas.classList.remove('drawing');
@@ -260,6 +310,12 @@ async function runGrabCut() {
             throw new Error(result.error || 'Processing failed');
         }
         
+        // Keep and show the rectangle the server used
+        if (result.rect) {
+            currentRect = result.rect;
+            drawRect(currentRect);
+        }
+        
         // Display results
         resultImage.src = result.result_image;
         maskImage.src = result.mask_image;
@@ -341,6 +397,7 @@ async function saveResult() {
 // Add event listeners
 imageInput.addEventListener('change', handleImageUpload);
 resetBtn.addEventListener('click', resetCanvas);
+autoRectBtn.addEventListener('click', useAutoRect);
 runBtn.addEventListener('click', runGrabCut);
 saveBtn.addEventListener('click', saveResult);
 sidebarToggle.addEventListener('click', toggleSidebar);
\ No newline at end of file